@@ -18,6 +18,7 @@ For each token read from stdin, the placeholder is replaced with the token
 Key features
 ------------
 - Safe shell quoting by default via :func:`shlex.quote`.
+- Optional shell-less execution (``--exec``) for simple ``prog {}`` templates.
 - Custom placeholder (default: ``"{}"``).
 - Custom delimiters (``-d``), NUL mode (``-0``), or robust default
   :meth:`str.splitlines` behavior.
@@ -61,13 +62,21 @@ for any consequences of using this software.
 from __future__ import annotations
 
 import argparse
-import concurrent.futures
+import codecs
+import errno
+import functools
+import io
+import itertools
+import mmap
 import os
 import re
 import shlex
+import shutil
+import signal
+import stat
 import subprocess
 import sys
-from collections.abc import Sequence
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
 from typing import Any
 
 EXIT_OK: int = 0
@@ -77,6 +86,29 @@ EXIT_BAD_ENV: int = 66
 EXIT_NEEDS_NO_STDIN_FOR_PAR: int = 67
 EXIT_CHILD_FAILED: int = 70
 
+# Every line boundary recognized by str.splitlines()
+_LINE_BREAKS: frozenset[str] = frozenset("\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
+# Regular-file stdin of at least this size is memory-mapped instead of read
+_MMAP_THRESHOLD: int = 1 << 20
+
+# Children are started via os.posix_spawn() where available (POSIX)
+_HAVE_POSIX_SPAWN: bool = hasattr(os, "posix_spawn")
+
+# Signals Python ignores at startup; children get their default action back
+_SIGDEF: tuple[int, ...] = tuple(
+    getattr(signal, name) for name in ("SIGPIPE", "SIGXFSZ") if hasattr(signal, name)
+)
+
+# Same character class as :func:`shlex.quote` uses internally; a token without
+# any match needs no quoting at all
+_UNSAFE = re.compile(r"[^\w@%+=:,./-]", re.ASCII).search
+
+# Characters that keep a special meaning inside POSIX double quotes
+_DQ_TABLE: dict[int, str] = str.maketrans(
+    {'"': '\\"', "\\": "\\\\", "$": "\\$", "`": "\\`"}
+)
+
 
 def eprint(*args: Any) -> None:
     """Print the given arguments to stderr.
@@ -90,11 +122,25 @@ def eprint(*args: Any) -> None:
     print(*args, file=sys.stderr)
 
 
+def write_trace(commands: Iterable[str]) -> None:
+    """Write ``+ command`` trace lines to stderr in a single call.
+
+    Parameters
+    ----------
+    commands : Iterable[str]
+        Final commands about to be executed, in order.
+    """
+    sys.stderr.write("".join(f"+ {command}\n" for command in commands))
+    sys.stderr.flush()
+
+
 def compile_delimiters_regex(delimiters: Sequence[str]) -> re.Pattern[str]:
     """Compile a union regex from literal delimiters.
 
     Each delimiter is treated as a literal substring
     (escaped using :func:`re.escape`), and the final pattern matches any of them.
+    Longer delimiters are tried first, so overlapping ones (e.g. ``","`` and ``",,"``)
+    follow longest-match semantics regardless of their order on the command line.
 
     Parameters
     ----------
@@ -106,7 +152,7 @@ def compile_delimiters_regex(delimiters: Sequence[str]) -> re.Pattern[str]:
     re.Pattern
         Compiled regular expression that matches any of the delimiters.
     """
-    escaped = (re.escape(d) for d in delimiters)
+    escaped = (re.escape(d) for d in sorted(delimiters, key=len, reverse=True))
     pattern: str = "|".join(escaped)
     return re.compile(pattern)
 
@@ -114,6 +160,10 @@ def compile_delimiters_regex(delimiters: Sequence[str]) -> re.Pattern[str]:
 def decode_stdin(encoding: str, errors: str) -> str:
     """Read stdin as bytes and decode it into text.
 
+    When stdin is a regular file, its size is taken from :func:`os.fstat`:
+    small files are read with as few :func:`os.read` calls as possible,
+    files of 1 MiB and more are memory-mapped and decoded in place.
+
     Parameters
     ----------
     encoding : str
@@ -127,18 +177,48 @@ def decode_stdin(encoding: str, errors: str) -> str:
     str
         Decoded stdin contents as a single string.
     """
-    data: bytes = sys.stdin.buffer.read()
-    return data.decode(encoding, errors=errors)
-
-
-def tokenize_input(
+    try:
+        fd: int = sys.stdin.fileno()
+        st: os.stat_result = os.fstat(fd)
+    except (AttributeError, OSError, ValueError):
+        # Not backed by a real file descriptor (e.g. replaced by io.StringIO)
+        return sys.stdin.buffer.read().decode(encoding, errors=errors)
+
+    if not stat.S_ISREG(st.st_mode):
+        data: bytes = sys.stdin.buffer.read()
+        return data.decode(encoding, errors=errors)
+
+    # Regular file (``each ... < file``): the size is known up front
+    pos: int = os.lseek(fd, 0, os.SEEK_CUR)
+    size: int = st.st_size - pos
+    if pos == 0 and size >= _MMAP_THRESHOLD:
+        # Decode straight from the page cache, skipping the copy into a bytes object
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mapped:
+            text: str = str(mapped, encoding, errors)
+        # Leave stdin at EOF, as a full read would, for children inheriting it
+        os.lseek(fd, 0, os.SEEK_END)
+        return text
+
+    chunks: list[bytes] = []
+    while size > 0:
+        chunk: bytes = os.read(fd, size)
+        if not chunk:
+            break
+        chunks.append(chunk)
+        size -= len(chunk)
+    # Anything appended to the file in the meantime
+    chunks.append(sys.stdin.buffer.read())
+    return b"".join(chunks).decode(encoding, errors=errors)
+
+
+def iter_tokens(
         text: str,
         delimiters: Sequence[str] | None,
         use_null: bool,
         keep_empty: bool,
         strip_ws: bool,
-) -> list[str]:
-    """Split input text into tokens according to the chosen strategy.
+) -> Iterator[str]:
+    """Lazily split input text into tokens according to the chosen strategy.
 
     Parameters
     ----------
@@ -146,7 +226,8 @@ def tokenize_input(
         Entire stdin content (already decoded).
     delimiters : Sequence[str] or None
         Optional literal delimiters. If provided and ``use_null`` is ``False``,
-        a regex is built that splits on any of these delimiters.
+        the text is split on any of these delimiters (via :meth:`str.split`
+        for a single delimiter, otherwise via a regex).
         If ``None`` and ``use_null`` is ``False``, :meth:`str.splitlines` is used.
     use_null : bool
         If ``True``, split on NUL characters (``"\\x00"``) regardless of ``delimiters``.
@@ -157,30 +238,221 @@ def tokenize_input(
         If ``True``, strip leading and trailing whitespace from each token
         before evaluating emptiness and before returning.
 
-    Returns
-    -------
-    list[str]
-        List of tokens in the order they appear.
+    Yields
+    ------
+    str
+        Tokens in the order they appear.
     """
+    parts: Iterable[str]
     if use_null:
-        parts: list[str] = text.split("\x00")
+        parts = text.split("\x00")
     elif delimiters:
-        delimiters_regex: re.Pattern[str] = compile_delimiters_regex(delimiters)
-        parts = delimiters_regex.split(text)
+        unique: set[str] = set(delimiters)
+        if len(unique) == 1 and delimiters[0]:
+            # A single literal delimiter does not need the regex engine
+            parts = text.split(delimiters[0])
+        else:
+            parts = _iter_regex_gaps(
+                compile_delimiters_regex(delimiters), text, keep_empty=keep_empty
+            )
     else:
         # Robust across ``\n``, ``\r\n``, ``\r``
         parts = text.splitlines()
 
-    tokens: list[str] = []
-    append = tokens.append
+    yield from _select_tokens(parts, keep_empty=keep_empty, strip_ws=strip_ws)
+
+
+def iter_stdin_tokens(
+        encoding: str,
+        errors: str,
+        use_null: bool,
+        keep_empty: bool,
+        strip_ws: bool,
+) -> Iterator[str]:
+    """Stream tokens from stdin without reading it to EOF first.
+
+    Supports the NUL and default (:meth:`str.splitlines`) strategies
+    and yields exactly the same tokens as :func:`iter_tokens` would
+    for the fully decoded stdin, while keeping only the current chunk
+    (and the lines split from it) in memory.
+
+    Parameters
+    ----------
+    encoding : str
+        Text encoding (for example ``"utf-8"``).
+    errors : str
+        Error strategy (for example ``"strict"``, ``"replace"``,
+        or ``"surrogatepass"``).
+    use_null : bool
+        If ``True``, split on NUL characters; otherwise split into lines.
+    keep_empty : bool
+        If ``True``, keep empty tokens.
+    strip_ws : bool
+        If ``True``, strip leading and trailing whitespace from each token.
+
+    Yields
+    ------
+    str
+        Tokens in the order they arrive.
+    """
+    parts: Iterable[str]
+    if use_null:
+        parts = _iter_stdin_records(encoding, errors, "\x00")
+    else:
+        parts = itertools.chain.from_iterable(_iter_stdin_lines(encoding, errors))
+    yield from _select_tokens(parts, keep_empty=keep_empty, strip_ws=strip_ws)
+
+
+def _iter_stdin_lines(encoding: str, errors: str) -> Iterator[list[str]]:
+    """Yield the lines of stdin in slices, one list per chunk read.
+
+    Equivalent to ``decode_stdin(...).splitlines()``, but stdin is read
+    in chunks of up to 1 MiB, so only one slice of lines is alive at a time
+    and each slice is split by a single :meth:`str.splitlines` call.
+
+    Parameters
+    ----------
+    encoding : str
+        Text encoding.
+    errors : str
+        Error strategy.
+
+    Yields
+    ------
+    list[str]
+        Consecutive complete lines (without line breaks); the unterminated
+        last line is carried over into the next slice.
+    """
+    # Universal newlines keep a ``\r\n`` split across two chunks as one break
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(encoding)(errors=errors), translate=True
+    )
+    read1 = sys.stdin.buffer.read1
+    pending: list[str] = []
+
+    while True:
+        data: bytes = read1(1 << 20)
+        chunk: str = decoder.decode(data, final=not data)
+        if chunk:
+            lines: list[str] = chunk.splitlines()
+            tail: str | None = None if chunk[-1] in _LINE_BREAKS else lines.pop()
+            if lines and pending:
+                lines[0] = "".join(pending) + lines[0]
+                pending = []
+            if tail is not None:
+                pending.append(tail)
+            if lines:
+                yield lines
+        if not data:
+            break
+
+    if pending:
+        yield ["".join(pending)]
+
+
+def _iter_stdin_records(encoding: str, errors: str, separator: str) -> Iterator[str]:
+    """Yield ``separator``-delimited records from stdin as they arrive.
+
+    Equivalent to ``decode_stdin(...).split(separator)``, but stdin is read
+    in chunks of up to 64 KiB and decoded incrementally.
+
+    Parameters
+    ----------
+    encoding : str
+        Text encoding.
+    errors : str
+        Error strategy.
+    separator : str
+        Single-character record separator.
+
+    Yields
+    ------
+    str
+        Consecutive records, including empty ones and the final tail.
+    """
+    decoder = codecs.getincrementaldecoder(encoding)(errors=errors)
+    read1 = sys.stdin.buffer.read1
+    pending: list[str] = []
+
+    while True:
+        data: bytes = read1(65536)
+        chunk: str = decoder.decode(data, final=not data)
+        if separator in chunk:
+            parts: list[str] = chunk.split(separator)
+            pending.append(parts[0])
+            parts[0] = "".join(pending)
+            pending = [parts.pop()]
+            yield from parts
+        elif chunk:
+            pending.append(chunk)
+        if not data:
+            break
+
+    yield "".join(pending)
+
+
+def _select_tokens(
+        parts: Iterable[str],
+        keep_empty: bool,
+        strip_ws: bool,
+) -> Iterator[str]:
+    """Apply the ``--strip`` and ``--keep-empty`` rules to raw parts.
+
+    Parameters
+    ----------
+    parts : Iterable[str]
+        Raw parts produced by a splitting strategy.
+    keep_empty : bool
+        If ``True``, keep empty tokens.
+    strip_ws : bool
+        If ``True``, strip leading and trailing whitespace before
+        evaluating emptiness.
 
+    Yields
+    ------
+    str
+        Selected tokens.
+    """
     for part in parts:
         token: str = part.strip() if strip_ws else part
         if not token and not keep_empty:
             continue
-        append(token)
+        yield token
 
-    return tokens
+
+def _iter_regex_gaps(
+        regex: re.Pattern[str],
+        text: str,
+        keep_empty: bool = True,
+) -> Iterator[str]:
+    """Yield the slices of ``text`` between matches of ``regex``.
+
+    Equivalent to ``regex.split(text)`` for a pattern without groups,
+    but without materializing the list of parts.
+
+    Parameters
+    ----------
+    regex : re.Pattern
+        Compiled delimiter pattern.
+    text : str
+        Text to split.
+    keep_empty : bool, optional
+        If ``False``, empty gaps (consecutive, leading or trailing delimiters)
+        are skipped with an index comparison, before any slice is created.
+
+    Yields
+    ------
+    str
+        Consecutive parts.
+    """
+    prev: int = 0
+    for match in regex.finditer(text):
+        start: int = match.start()
+        if start > prev or keep_empty:
+            yield text[prev:start]
+        prev = match.end()
+    if len(text) > prev or keep_empty:
+        yield text[prev:]
 
 
 def apply_environment(env_kv: Sequence[str]) -> dict[str, str]:
@@ -217,6 +489,82 @@ def apply_environment(env_kv: Sequence[str]) -> dict[str, str]:
     return merged
 
 
+def encode_environment(
+        env: Mapping[str, str] | None,
+) -> Mapping[str, str] | Mapping[bytes, bytes] | None:
+    """Encode the child environment once, ahead of spawning children.
+
+    :func:`os.posix_spawn` and :mod:`subprocess` convert the environment
+    into ``KEY=VALUE`` C strings on every spawn; handing them a plain
+    ``bytes`` mapping spares the per-spawn walk over :data:`os.environ`
+    and the ``str`` to ``bytes`` encoding of every entry.
+
+    Parameters
+    ----------
+    env : Mapping[str, str] or None
+        Mapping built by :func:`apply_environment`, or ``None`` to use
+        the current :data:`os.environ`.
+
+    Returns
+    -------
+    Mapping or None
+        A ``dict[bytes, bytes]`` snapshot on platforms with a bytes environment
+        (POSIX); otherwise ``env`` unchanged.
+    """
+    if not os.supports_bytes_environ:
+        return env
+    if env is None:
+        return dict(os.environb)
+    return {os.fsencode(key): os.fsencode(val) for key, val in env.items()}
+
+
+def quote_argument(argument: str) -> str:
+    """Shell-quote a single token, exactly like :func:`shlex.quote`.
+
+    Tokens made only of safe ASCII characters are returned unchanged without
+    entering :func:`shlex.quote`, which is the common case for file names.
+
+    Parameters
+    ----------
+    argument : str
+        Token to quote.
+
+    Returns
+    -------
+    str
+        Token that the shell will read back as one literal word.
+    """
+    if not argument:
+        return "''"
+    if argument.isascii() and _UNSAFE(argument) is None:
+        # Fast path: plain file names and words are safe verbatim
+        return argument
+    return shlex.quote(argument)
+
+
+def quote_argument_dq(argument: str) -> str:
+    """Quote a single token with POSIX double quotes (``--fast-quote``).
+
+    Inside double quotes only ``"``, ``\\``, ``$`` and the backtick are special,
+    so escaping them with one :meth:`str.translate` pass is enough;
+    this avoids the slower :func:`shlex.quote` for tokens that need quoting.
+
+    Parameters
+    ----------
+    argument : str
+        Token to quote.
+
+    Returns
+    -------
+    str
+        Token that a POSIX shell will read back as one literal word.
+    """
+    if argument and argument.isascii() and _UNSAFE(argument) is None:
+        # Fast path: plain file names and words are safe verbatim
+        return argument
+    return '"' + argument.translate(_DQ_TABLE) + '"'
+
+
 def build_command(
         template: str,
         placeholder: str,
@@ -243,16 +591,204 @@ def build_command(
     str
         Final shell command string with placeholder occurrences replaced.
     """
-    arg: str = shlex.quote(argument) if quote else argument
+    arg: str = quote_argument(argument) if quote else argument
     return template.replace(placeholder, arg)
 
 
+def _spawn(
+        command: str | Sequence[str],
+        use_shell: bool,
+        shell_path: str | None,
+        pass_stdin: bool,
+        env: Mapping[str, str] | Mapping[bytes, bytes] | None,
+) -> int:
+    """Start a child with :func:`os.posix_spawn` and return its pid.
+
+    Unlike ``fork()`` + ``execve()``, ``posix_spawn`` does not duplicate the
+    parent's page tables, so the cost of starting a child does not grow
+    with the size of this process.
+
+    Parameters
+    ----------
+    command : str or Sequence[str]
+        Shell string (``use_shell=True``) or argument vector (``use_shell=False``).
+    use_shell : bool
+        If ``True``, run ``command`` as ``<shell> -c command``.
+    shell_path : str or None
+        Shell executable; defaults to ``/bin/sh`` like ``subprocess`` does.
+    pass_stdin : bool
+        If ``True``, the child inherits our stdin; otherwise it gets ``/dev/null``.
+    env : Mapping or None
+        Custom environment mapping (``str`` or pre-encoded ``bytes``, see
+        :func:`encode_environment`); if ``None``, :data:`os.environ` is used.
+
+    Returns
+    -------
+    int
+        Pid of the started child.
+
+    Raises
+    ------
+    OSError
+        If the child cannot be started (for example, the program does not exist).
+    """
+    file_actions: list[tuple[Any, ...]] = (
+        [] if pass_stdin
+        else [(os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0)]
+    )
+    if use_shell:
+        shell: str = shell_path or "/bin/sh"
+        return _posix_spawn(shell, [shell, "-c", command], env, file_actions)
+    return _posix_spawn(command[0], command, env, file_actions)
+
+
+def _posix_spawn(
+        program: str,
+        argv: Sequence[str],
+        env: Mapping[str, str] | Mapping[bytes, bytes] | None,
+        file_actions: Sequence[tuple[Any, ...]],
+) -> int:
+    """Call :func:`os.posix_spawn` with the process setup ``subprocess`` performs.
+
+    A ``program`` without a path separator is looked up on the child's ``PATH``,
+    and the signals Python ignores (``SIGPIPE``, ``SIGXFSZ``) are reset
+    to their default action, like ``subprocess``'s ``restore_signals=True``;
+    otherwise pipelines such as ``yes | head`` would report broken pipes.
+
+    Parameters
+    ----------
+    program : str
+        Executable to start (absolute/relative path or bare name).
+    argv : Sequence[str]
+        Argument vector, including ``argv[0]``.
+    env : Mapping or None
+        Child environment; if ``None``, :data:`os.environ` is used.
+    file_actions : Sequence[tuple]
+        File actions for :func:`os.posix_spawn`.
+
+    Returns
+    -------
+    int
+        Pid of the started child.
+
+    Raises
+    ------
+    OSError
+        If the child cannot be started (for example, the program does not exist).
+    """
+    environment = os.environ if env is None else env
+    if os.sep not in program:
+        search_path = environment.get(b"PATH", environment.get("PATH"))
+        resolved: str | None = _which(
+            program, os.defpath if search_path is None else os.fsdecode(search_path)
+        )
+        if resolved is None:
+            raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), program)
+        program = resolved
+    return os.posix_spawn(
+        program, argv, environment, file_actions=file_actions, setsigdef=_SIGDEF
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _which(program: str, search_path: str) -> str | None:
+    """Look up an executable on a search path, caching the result.
+
+    The same program (the shell, or the ``--exec`` command) is started
+    for every token, so :func:`shutil.which` runs only once per run.
+
+    Parameters
+    ----------
+    program : str
+        Executable name without a path separator.
+    search_path : str
+        ``os.pathsep``-separated list of directories (the child's ``PATH``).
+
+    Returns
+    -------
+    str or None
+        Full path of the executable, or ``None`` if it was not found.
+    """
+    return shutil.which(program, path=search_path)
+
+
+def iter_commands(
+        tokens: Iterable[str],
+        template_parts: Sequence[str],
+        quoter: Callable[[str], str] | None,
+) -> Iterator[str]:
+    """Yield the final shell command for every token.
+
+    The substitution is inlined into the loop (one generator frame instead of
+    a :func:`build_command` call per token), and the usual single placeholder
+    is specialized into ``prefix + arg + suffix``.
+
+    Parameters
+    ----------
+    tokens : Iterable[str]
+        Input tokens.
+    template_parts : Sequence[str]
+        Command template split around the placeholder
+        (``template.split(placeholder)``).
+    quoter : Callable[[str], str] or None
+        Quoting function (:func:`quote_argument` or :func:`quote_argument_dq`),
+        or ``None`` to insert tokens as is. Tokens made only of safe ASCII
+        characters are inserted verbatim without calling it.
+
+    Yields
+    ------
+    str
+        Final shell command string per token, in order.
+    """
+    unsafe = _UNSAFE
+    if len(template_parts) == 2:
+        prefix, suffix = template_parts
+        if quoter is None:
+            for tok in tokens:
+                yield prefix + tok + suffix
+        else:
+            for tok in tokens:
+                if not tok or not tok.isascii() or unsafe(tok) is not None:
+                    tok = quoter(tok)
+                yield prefix + tok + suffix
+    elif quoter is None:
+        for tok in tokens:
+            yield tok.join(template_parts)
+    else:
+        for tok in tokens:
+            if not tok or not tok.isascii() or unsafe(tok) is not None:
+                tok = quoter(tok)
+            yield tok.join(template_parts)
+
+
+def iter_argvs(
+        tokens: Iterable[str],
+        argv_parts: Sequence[Sequence[str]],
+) -> Iterator[list[str]]:
+    """Yield the final argument vector (``--exec``) for every token.
+
+    Parameters
+    ----------
+    tokens : Iterable[str]
+        Input tokens.
+    argv_parts : Sequence[Sequence[str]]
+        Every word of the pre-split template, split around the placeholder.
+
+    Yields
+    ------
+    list[str]
+        Argument vector per token, in order.
+    """
+    for tok in tokens:
+        yield [tok.join(word) for word in argv_parts]
+
+
 def run_command(
         command_str: str,
         shell_path: str | None,
         pass_stdin: bool,
         trace: bool,
-        env: dict[str, str] | None,
+        env: Mapping[str, str] | Mapping[bytes, bytes] | None,
 ) -> int:
     """Execute a single shell command string.
 
@@ -265,12 +801,14 @@ def run_command(
         Otherwise, the system default shell is used.
     pass_stdin : bool
         If ``True``, forward the current process's stdin to the child.
+        Otherwise the child reads from ``/dev/null``.
         This must be ``False`` when running commands in parallel.
     trace : bool
         If ``True``, print the command to stderr before running it
         (similar to ``xargs -t``).
-    env : dict[str, str] or None
-        Custom environment mapping; if ``None``,
+    env : Mapping or None
+        Custom environment mapping (``str`` or pre-encoded ``bytes``, see
+        :func:`encode_environment`); if ``None``,
         the child inherits :data:`os.environ`.
 
     Returns
@@ -279,11 +817,16 @@ def run_command(
         Child process exit code (``0`` means success).
     """
     if trace:
-        eprint(f"+ {command_str}")
+        write_trace((command_str,))
+
+    if _HAVE_POSIX_SPAWN:
+        pid: int = _spawn(command_str, True, shell_path, pass_stdin, env)
+        _, status = os.waitpid(pid, 0)
+        return _exit_code(status)
 
     # When pass_stdin=False we avoid passing our stdin to the child,
-    # which is important in parallel mode
-    stdin = sys.stdin if pass_stdin else None
+    # which is important in parallel mode and when stdin is streamed
+    stdin = None if pass_stdin else subprocess.DEVNULL
 
     # Note: text=False keeps raw bytes for stdio, avoiding encoding surprises
     completed = subprocess.run(
@@ -300,6 +843,325 @@ def run_command(
     return completed.returncode
 
 
+def run_command_argv(
+        argv: Sequence[str],
+        pass_stdin: bool,
+        trace: bool,
+        env: Mapping[str, str] | Mapping[bytes, bytes] | None,
+) -> int:
+    """Execute a single argument vector directly, without a shell.
+
+    Parameters
+    ----------
+    argv : Sequence[str]
+        Program and arguments (``argv[0]`` is looked up on ``PATH``).
+    pass_stdin : bool
+        If ``True``, forward the current process's stdin to the child.
+        Otherwise the child reads from ``/dev/null``.
+        This must be ``False`` when running commands in parallel.
+    trace : bool
+        If ``True``, print the command to stderr before running it
+        (similar to ``xargs -t``).
+    env : Mapping or None
+        Custom environment mapping (``str`` or pre-encoded ``bytes``, see
+        :func:`encode_environment`); if ``None``,
+        the child inherits :data:`os.environ`.
+
+    Returns
+    -------
+    int
+        Child process exit code (``0`` means success).
+        Mirrors the shell conventions ``127`` (command not found)
+        and ``126`` (command not executable) when the program cannot be started.
+    """
+    if trace:
+        write_trace((shlex.join(argv),))
+
+    try:
+        if _HAVE_POSIX_SPAWN:
+            pid: int = _spawn(argv, False, None, pass_stdin, env)
+            _, status = os.waitpid(pid, 0)
+            return _exit_code(status)
+
+        completed = subprocess.run(
+            argv,
+            shell=False,
+            stdin=None if pass_stdin else subprocess.DEVNULL,
+            stdout=sys.stdout,
+            stderr=sys.stderr,
+            text=False,
+            check=False,
+            env=env,
+        )
+    except FileNotFoundError as exc:
+        eprint(f"ERROR: {exc}")
+        return 127
+    except OSError as exc:
+        eprint(f"ERROR: {exc}")
+        return 126
+    return completed.returncode
+
+
+def _disinherit_fds() -> None:
+    """Mark every inherited descriptor above stderr as non-inheritable.
+
+    :func:`os.posix_spawn` passes all inheritable descriptors on to the child;
+    this restores the ``close_fds=True`` behavior of ``subprocess``, so that,
+    for example, pipe write ends or jobserver fds given to ``each`` do not leak
+    into every command (and keep a reader from ever seeing EOF).
+    Descriptors created by Python itself are non-inheritable already.
+    """
+    try:
+        fds: list[str] = os.listdir("/dev/fd")
+    except OSError:
+        return
+    for name in fds:
+        fd: int = int(name)
+        if fd <= 2:
+            continue
+        try:
+            if os.get_inheritable(fd):
+                os.set_inheritable(fd, False)
+        except OSError:
+            # Closed meanwhile (e.g. the descriptor used to list /dev/fd)
+            continue
+
+
+def _exit_code(status: int) -> int:
+    """Convert a raw :func:`os.waitpid` status into a ``Popen``-style return code.
+
+    Parameters
+    ----------
+    status : int
+        Wait status as returned by :func:`os.waitpid`.
+
+    Returns
+    -------
+    int
+        Exit code of the child, or ``-N`` if it was terminated by signal ``N``.
+    """
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def run_parallel(
+        commands: Iterable[str | Sequence[str]],
+        max_procs: int,
+        use_shell: bool,
+        shell_path: str | None,
+        trace: bool,
+        env: Mapping[str, str] | Mapping[bytes, bytes] | None,
+) -> int:
+    """Run commands with up to ``max_procs`` children alive at once.
+
+    A single-threaded scheduler: children are started with
+    :func:`os.posix_spawn` and reaped with ``os.waitpid(-1, 0)``,
+    so only the running children are tracked and ``commands`` is consumed lazily.
+    Every child that has finished by the time a slot frees up is reaped at once,
+    and the freed slots are refilled (and traced) as one batch.
+    Without :func:`os.posix_spawn`, children are started with
+    :class:`subprocess.Popen` and the oldest one is waited for instead.
+    With ``trace``, failing children are reported together with their command.
+    Children never receive this process's stdin.
+
+    Parameters
+    ----------
+    commands : Iterable[str or Sequence[str]]
+        Shell strings (``use_shell=True``) or argument vectors (``use_shell=False``).
+    max_procs : int
+        Maximum number of concurrently running children.
+    use_shell : bool
+        If ``True``, run each command through the shell.
+    shell_path : str or None
+        Shell executable used when ``use_shell`` is ``True``.
+    trace : bool
+        If ``True``, print each command to stderr before starting it,
+        and report each command that fails.
+    env : Mapping or None
+        Custom environment mapping (``str`` or pre-encoded ``bytes``, see
+        :func:`encode_environment`); if ``None``,
+        the children inherit :data:`os.environ`.
+
+    Returns
+    -------
+    int
+        ``0`` if every child succeeded, otherwise the first non-zero exit code
+        observed (in completion order).
+    """
+    return_code: int = EXIT_OK
+    # pid -> command of every running child, for diagnostics
+    running: dict[int, str | Sequence[str]] = {}
+    # pid -> Popen, only used without posix_spawn (subprocess fallback)
+    procs: dict[int, subprocess.Popen[bytes]] = {}
+
+    def record(rc: int) -> None:
+        nonlocal return_code
+        if rc != 0 and return_code == EXIT_OK:
+            return_code = rc or EXIT_CHILD_FAILED
+
+    def finish(command: str | Sequence[str], rc: int) -> None:
+        if rc != 0 and trace:
+            # Completion order is arbitrary, so name the failed command
+            reason: str = f"signal {-rc}" if rc < 0 else f"exit code {rc}"
+            shown: str = command if use_shell else shlex.join(command)
+            eprint(f"ERROR: command failed ({reason}): {shown}")
+        record(rc)
+
+    def reap() -> None:
+        if not _HAVE_POSIX_SPAWN:
+            # No waitpid(-1) here: wait for the oldest running child
+            pid: int = next(iter(running))
+            finish(running.pop(pid), procs.pop(pid).wait())
+            return
+
+        # Block until one of our children finishes, then collect every other one
+        # that has already finished, so the freed slots are refilled as one batch.
+        # waitpid(-1) may also return children we did not start (e.g. inherited
+        # through exec); those free no slot and do not end the blocking wait.
+        flags: int = 0
+        while running:
+            pid, status = os.waitpid(-1, flags)
+            if pid == 0:
+                break
+            command = running.pop(pid, None)
+            if command is not None:
+                flags = os.WNOHANG
+                finish(command, _exit_code(status))
+
+    pending: Iterator[str | Sequence[str]] = iter(commands)
+    while True:
+        while len(running) >= max_procs:
+            reap()
+
+        # At least one slot is free here, so an empty batch means no more input
+        batch: list[str | Sequence[str]] = list(
+            itertools.islice(pending, max_procs - len(running))
+        )
+        if not batch:
+            break
+
+        if trace:
+            # One write per batch instead of one per command
+            write_trace(batch if use_shell else map(shlex.join, batch))
+
+        for command in batch:
+            try:
+                if _HAVE_POSIX_SPAWN:
+                    pid: int = _spawn(command, use_shell, shell_path, False, env)
+                else:
+                    proc = subprocess.Popen(
+                        command,
+                        shell=use_shell,
+                        executable=shell_path if use_shell else None,
+                        stdin=subprocess.DEVNULL,
+                        env=env,
+                    )
+                    pid = proc.pid
+                    procs[pid] = proc
+            except FileNotFoundError as exc:
+                eprint(f"ERROR: {exc}")
+                record(127)
+                continue
+            except OSError as exc:
+                eprint(f"ERROR: {exc}")
+                record(126)
+                continue
+            running[pid] = command
+
+    while running:
+        reap()
+
+    return return_code
+
+
+def run_coproc(
+        commands: Iterable[str],
+        shell_path: str | None,
+        trace: bool,
+        env: Mapping[str, str] | Mapping[bytes, bytes] | None,
+) -> int:
+    """Run shell commands one after another in a single long-lived shell.
+
+    The shell reads commands from a pipe on its stdin and reports each exit status
+    on file descriptor 3, so only one shell process is started for all tokens.
+    Every command is passed to ``eval`` with ``/dev/null`` as stdin
+    and without access to fd 3.
+
+    Parameters
+    ----------
+    commands : Iterable[str]
+        Final shell command strings, executed in order.
+    shell_path : str or None
+        Shell executable to start; defaults to ``/bin/sh``.
+    trace : bool
+        If ``True``, print each command to stderr before running it.
+    env : Mapping or None
+        Custom environment mapping (``str`` or pre-encoded ``bytes``, see
+        :func:`encode_environment`); if ``None``,
+        the shell inherits :data:`os.environ`.
+
+    Returns
+    -------
+    int
+        ``0`` if every command succeeded, otherwise the first non-zero exit code.
+        Execution stops at the first failure, like the sequential path.
+    """
+    shell: str = shell_path or "/bin/sh"
+    script_r, script_w = os.pipe()
+    status_r, status_w = os.pipe()
+    try:
+        pid: int = _posix_spawn(
+            shell,
+            [shell],
+            env,
+            [
+                (os.POSIX_SPAWN_DUP2, script_r, 0),
+                (os.POSIX_SPAWN_DUP2, status_w, 3),
+            ],
+        )
+    finally:
+        os.close(script_r)
+        os.close(status_w)
+
+    return_code: int = EXIT_OK
+    shell_exited: bool = False
+    with open(script_w, "wb") as script, open(status_r, "rb") as status:
+        try:
+            for command in commands:
+                if trace:
+                    write_trace((command,))
+                if "\0" in command:
+                    # Same as posix_spawn()/subprocess; the shell would silently drop it
+                    raise ValueError("embedded null byte")
+                # ``eval`` of the quoted text runs in the same shell, and a command
+                # that does not parse on its own cannot swallow the framing
+                script.write(
+                    b"eval "
+                    + os.fsencode(shlex.quote(command))
+                    + b" </dev/null 3>&-\necho $? >&3\n"
+                )
+                script.flush()
+
+                line: bytes = status.readline()
+                if not line:
+                    # The shell itself exited (``exit`` in the command, syntax error, ...)
+                    shell_exited = True
+                    break
+                rc: int = int(line)
+                if rc != 0:
+                    return_code = rc
+                    break
+        except BrokenPipeError:
+            shell_exited = True
+
+    _, wait_status = os.waitpid(pid, 0)
+    if shell_exited:
+        # Report the shell's own exit code when it terminated early
+        return _exit_code(wait_status) or EXIT_CHILD_FAILED
+    return return_code
+
+
 def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
     """Parse command-line arguments for the ``each`` CLI.
 
@@ -423,6 +1285,14 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
             "spaces or metacharacters)."
         ),
     )
+    parser.add_argument(
+        "--fast-quote",
+        action="store_true",
+        help=(
+            "Quote tokens with POSIX double quotes, escaping only \\ \" $ and `, "
+            "instead of shlex.quote (faster for tokens that need quoting)."
+        ),
+    )
     parser.add_argument(
         "--env",
         action="append",
@@ -437,6 +1307,26 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
             "Default: system default for shell=True."
         ),
     )
+    parser.add_argument(
+        "--exec",
+        action="store_true",
+        help=(
+            "Split the command once with shlex and execute it directly, "
+            "without a shell. Tokens are substituted into the words unquoted; "
+            "pipes, redirections, and variables are not available "
+            "and --shell is ignored."
+        ),
+    )
+    parser.add_argument(
+        "--coproc",
+        action="store_true",
+        help=(
+            "Feed all commands to one long-lived shell instead of starting "
+            "a shell per token (sequential mode with --no-stdin only; "
+            "otherwise ignored). Shell state such as cd or variables "
+            "carries over between commands."
+        ),
+    )
 
     args: argparse.Namespace = parser.parse_args(argv)
 
@@ -446,9 +1336,28 @@ def parse_args(argv: Sequence[str] | None = None) -> argparse.Namespace:
         eprint(f"ERROR: command must contain placeholder {placeholder!r}")
         raise SystemExit(EXIT_NO_PLACEHOLDER)
 
-    # Validate environment items (structure only)
+    # Split the template around the placeholder once, so that building a
+    # command per token is a plain concatenation (see main())
+    args._template_parts = args.command.split(placeholder)
+
+    # Pre-split the template once for direct (shell-less) execution
+    if args.exec:
+        try:
+            args._argv_template = shlex.split(args.command)
+        except ValueError as exc:
+            eprint(f"ERROR: cannot split command for --exec: {exc}")
+            raise SystemExit(EXIT_USAGE) from exc
+        if not any(placeholder in word for word in args._argv_template):
+            eprint(
+                f"ERROR: command must contain placeholder {placeholder!r} "
+                "outside of shell quoting syntax"
+            )
+            raise SystemExit(EXIT_NO_PLACEHOLDER)
+        args._argv_parts = [word.split(placeholder) for word in args._argv_template]
+
+    # Validate environment items and keep the merged mapping for main()
     try:
-        _ = apply_environment(args.env)
+        args._env = apply_environment(args.env) if args.env else None
     except ValueError as exc:
         eprint(f"ERROR: {exc}")
         raise SystemExit(EXIT_BAD_ENV) from exc
@@ -483,88 +1392,117 @@ def main(argv: Sequence[str] | None = None) -> int:
 
     args: argparse.Namespace = parse_args(argv)
 
-    # Build environment (structure validated already)
-    env: dict[str, str] | None = apply_environment(args.env) if args.env else None
-
-    # Ingest and tokenize stdin.
-    text: str = decode_stdin(encoding=args.encoding, errors=args.errors)
-    tokens: list[str] = tokenize_input(
-        text=text,
-        delimiters=args.delimiter,
-        use_null=args.null,
-        keep_empty=bool(args.keep_empty),
-        strip_ws=bool(args.strip),
-    )
+    # Children must not inherit descriptors we were given (subprocess' close_fds)
+    if _HAVE_POSIX_SPAWN:
+        _disinherit_fds()
+
+    # Environment was built (and validated) by parse_args()
+    env: dict[str, str] | None = args._env
+    spawn_env = encode_environment(env)
+
+    # Ingest and tokenize stdin. Stream it when children never see our stdin
+    # (otherwise they would compete with us for the unread input)
+    # and the splitting strategy does not need the whole text.
+    tokens: Iterator[str]
+    if (args.no_stdin or args.dry_run) and (args.null or not args.delimiter):
+        tokens = iter_stdin_tokens(
+            encoding=args.encoding,
+            errors=args.errors,
+            use_null=args.null,
+            keep_empty=bool(args.keep_empty),
+            strip_ws=bool(args.strip),
+        )
+    else:
+        text: str = decode_stdin(encoding=args.encoding, errors=args.errors)
+        tokens = iter_tokens(
+            text=text,
+            delimiters=args.delimiter,
+            use_null=args.null,
+            keep_empty=bool(args.keep_empty),
+            strip_ws=bool(args.strip),
+        )
 
     # Short-circuit: nothing to do
-    if not tokens:
+    first: str | None = next(tokens, None)
+    if first is None:
         return EXIT_OK
+    tokens = itertools.chain((first,), tokens)
 
     # Pre-bind to local variables for minor speed/clarity improvements
-    template: str = args.command
-    placeholder: str = args.placeholder
-    quote: bool = not args.no_quote
+    quoter: Callable[[str], str] | None = None
+    if not args.no_quote:
+        quoter = quote_argument_dq if args.fast_quote else quote_argument
+    use_shell: bool = not args.exec
+
+    # Build commands lazily; the template was split around the placeholder
+    # in parse_args(), so per token only the (quoted) argument is joined in
+    commands: Iterator[str | list[str]]
+    if use_shell:
+        commands = iter_commands(tokens, args._template_parts, quoter)
+    else:
+        commands = iter_argvs(tokens, args._argv_parts)
 
     if args.dry_run:
-        for tok in tokens:
-            cmd_str: str = build_command(
-                template=template,
-                placeholder=placeholder,
-                argument=tok,
-                quote=quote,
-            )
-            print(cmd_str)
+        lines: Iterator[str] = commands if use_shell else map(shlex.join, commands)
+        write = sys.stdout.write
+        # Emit in blocks of lines: one write per block instead of a print() per token
+        while True:
+            block: list[str] = list(itertools.islice(lines, 8192))
+            if not block:
+                break
+            block.append("")
+            write("\n".join(block))
         return EXIT_OK
 
+    # Sequential execution path through a single long-lived shell
+    if (
+            args.coproc
+            and use_shell
+            and args.max_procs <= 1
+            and args.no_stdin
+            and _HAVE_POSIX_SPAWN
+    ):
+        return run_coproc(
+            commands=commands,
+            shell_path=args.shell,
+            trace=args.trace,
+            env=spawn_env,
+        )
+
     # Sequential execution path
     if args.max_procs <= 1:
-        for tok in tokens:
-            cmd_str: str = build_command(
-                template=template,
-                placeholder=placeholder,
-                argument=tok,
-                quote=quote,
-            )
-            rc: int = run_command(
-                command_str=cmd_str,
+        run: Callable[[Any], int]
+        if use_shell:
+            run = functools.partial(
+                run_command,
                 shell_path=args.shell,
                 pass_stdin=not args.no_stdin,
                 trace=args.trace,
-                env=env,
+                env=spawn_env,
+            )
+        else:
+            run = functools.partial(
+                run_command_argv,
+                pass_stdin=not args.no_stdin,
+                trace=args.trace,
+                env=spawn_env,
             )
+        for command in commands:
+            rc: int = run(command)
             if rc != 0:
                 # Propagate the first failing child exit code
                 return rc or EXIT_CHILD_FAILED
         return EXIT_OK
 
     # Parallel execution path (order of outputs is not guaranteed)
-    return_code: int = EXIT_OK
-    with concurrent.futures.ThreadPoolExecutor(max_workers=args.max_procs) as pool:
-        futures: list[concurrent.futures.Future[int]] = []
-        for tok in tokens:
-            cmd_str: str = build_command(
-                template=template,
-                placeholder=placeholder,
-                argument=tok,
-                quote=quote,
-            )
-            futures.append(
-                pool.submit(
-                    run_command,
-                    cmd_str,
-                    args.shell,
-                    False,  # pass_stdin is False in parallel mode
-                    args.trace,
-                    env,
-                )
-            )
-
-        for fut in concurrent.futures.as_completed(futures):
-            rc = fut.result()
-            if rc != 0 and return_code == EXIT_OK:
-                return_code = rc or EXIT_CHILD_FAILED
-
-    return return_code
+    return run_parallel(
+        commands=commands,
+        max_procs=args.max_procs,
+        use_shell=use_shell,
+        shell_path=args.shell,
+        trace=args.trace,
+        env=spawn_env,
+    )
 
 
 if __name__ == "__main__":